@@ -8,10 +8,11 @@ import asyncio
 import logging
 import signal
 import sys
-from threading import Thread
 from typing import Optional
 
-from src.config import load_config, ServerConfig
+from aiohttp import web
+
+from src.config import load_config, client_buffer_frames, ServerConfig
 from src.audio_capture import AudioCapture
 from src.connection_manager import ConnectionManager
 from src.ws_server import AudioWebSocketServer
@@ -56,8 +57,12 @@ class AudioStreamerServer:
         self.logger = setup_logger(self.config.log_level)
         
         self.audio_capture = AudioCapture(self.config, self.logger)
-        self.connection_manager = ConnectionManager(self.logger)
+        self.connection_manager = ConnectionManager(
+            self.logger,
+            queue_size=client_buffer_frames(self.config)
+        )
         self.ws_server: Optional[AudioWebSocketServer] = None
+        self.http_runner: Optional[web.AppRunner] = None
         self.is_shutting_down = False
         self._loop: Optional[asyncio.AbstractEventLoop] = None
     
@@ -88,23 +93,16 @@ class AudioStreamerServer:
         if self.ws_server:
             await self.ws_server.stop()
         
+        # Stop HTTP server
+        if self.http_runner:
+            await self.http_runner.cleanup()
+        
         # Stop audio capture
         self.audio_capture.stop()
         
         self.logger.info("Shutdown complete")
         sys.exit(0)
     
-    def _start_http_server(self) -> None:
-        """Start the HTTP server in a separate thread."""
-        host = get_local_ip()
-        app = create_app(
-            self.connection_manager,
-            self.config,
-            self.audio_capture.get_device_info()
-        )
-        self.logger.info(f"HTTP server: http://{host}:{self.config.http_port}")
-        app.run(host="0.0.0.0", port=self.config.http_port, threaded=True)
-    
     async def _run_async(self) -> None:
         """Run the async components."""
         self._loop = asyncio.get_event_loop()
@@ -128,6 +126,17 @@ class AudioStreamerServer:
         
         await self.ws_server.start()
         
+        # Serve HTTP on the same event loop
+        app = create_app(
+            self.connection_manager,
+            self.config,
+            self.audio_capture.get_device_info()
+        )
+        self.http_runner = web.AppRunner(app)
+        await self.http_runner.setup()
+        await web.TCPSite(self.http_runner, "0.0.0.0", self.config.http_port).start()
+        self.logger.info(f"HTTP server: http://{host}:{self.config.http_port}")
+        
         # Keep running until shutdown
         try:
             await asyncio.Future()
@@ -138,9 +147,13 @@ class AudioStreamerServer:
         """Start all server components."""
         self.logger.info("Starting Audio Streamer Server")
         
-        # Start HTTP server in background thread
-        http_thread = Thread(target=self._start_http_server, daemon=True)
-        http_thread.start()
+        # Prefer uvloop where available (not supported on Windows)
+        try:
+            import uvloop
+            uvloop.install()
+            self.logger.debug("Using uvloop event loop")
+        except ImportError:
+            self.logger.debug("uvloop not available, using default event loop")
         
         # Run async components
         asyncio.run(self._run_async())
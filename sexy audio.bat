@@ -36,13 +36,20 @@ echo %GREEN%[OK]%RESET% Working directory: %SCRIPT_DIR%
 where python >nul 2>&1
 if errorlevel 1 (
     echo %RED%[ERROR] Python not found in PATH.%RESET%
-    echo Please install Python 3.8+ from https://python.org
+    echo Please install Python 3.10+ from https://python.org
     pause
     exit /b 1
 )
 
 :: Get Python version
 for /f "tokens=2" %%i in ('python --version 2^>^&1') do set PYTHON_VERSION=%%i
+python -c "import sys; sys.exit(0 if sys.version_info >= (3, 10) else 1)" >nul 2>&1
+if errorlevel 1 (
+    echo %RED%[ERROR] Python 3.10+ required, found %PYTHON_VERSION%.%RESET%
+    echo Please install Python 3.10+ from https://python.org
+    pause
+    exit /b 1
+)
 echo %GREEN%[OK]%RESET% Python %PYTHON_VERSION% found
 
 :: Check/Create virtual environment
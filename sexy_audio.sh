@@ -58,11 +58,16 @@ fi
 
 if [[ -z "$PYTHON_CMD" ]]; then
     echo -e "${RED}[ERROR]${NC} Python 3 not found."
-    echo "Please install Python 3.8+ from https://python.org"
+    echo "Please install Python 3.10+ from https://python.org"
     exit 1
 fi
 
 PYTHON_VERSION=$($PYTHON_CMD --version 2>&1 | cut -d' ' -f2)
+if ! $PYTHON_CMD -c 'import sys; sys.exit(0 if sys.version_info >= (3, 10) else 1)'; then
+    echo -e "${RED}[ERROR]${NC} Python 3.10+ required, found $PYTHON_VERSION."
+    echo "Please install Python 3.10+ from https://python.org"
+    exit 1
+fi
 echo -e "${GREEN}[OK]${NC} Python $PYTHON_VERSION found ($PYTHON_CMD)"
 
 # Check/Create virtual environment
@@ -4,8 +4,9 @@ Audio capture module for the Audio Streamer server.
 Handles device discovery and audio capture via WASAPI loopback or Stereo Mix.
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Tuple
+from typing import Callable, Optional, List, Tuple
 
 import sounddevice as sd
 import numpy as np
@@ -26,17 +27,42 @@ class AudioCapture:
         """
         self.config = config
         self.logger = logger
-        self.stream: Optional[sd.InputStream] = None
+        self.stream: Optional[sd.RawInputStream] = None
         self.is_running: bool = False
         self.device_name: str = "Unknown"
+        
+        # Encoder for non-PCM codecs; imported lazily to keep Numba optional
+        self._encode: Optional[Callable[..., np.ndarray]] = None
+        if config.codec == "ulaw":
+            from .codec import pcm16_to_ulaw
+            self._encode = pcm16_to_ulaw
+        
+        # Reused encode buffer so the capture hot path does not allocate arrays
+        self._buf = np.empty(config.block_size * config.channels, dtype=np.uint8)
+        self._mv = memoryview(self._buf)
+        
+        # Blocks handed from the PortAudio callback thread to the event loop
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def initialize(self) -> bool:
         """
         Discover and initialize audio capture device.
         
+        Must be called from the running event loop that will consume
+        read_block(); captured blocks are handed to that loop.
+        
         Returns:
             True if initialization succeeded, False otherwise.
         """
+        if self._encode is not None:
+            # Pay the JIT compilation cost before streaming starts
+            self._encode(
+                np.zeros(self.config.block_size * self.config.channels, dtype=np.int16),
+                out=self._buf
+            )
+        
+        self._loop = asyncio.get_running_loop()
         devices = self._list_devices()
         
         # Try WASAPI loopback first
@@ -67,26 +93,70 @@ class AudioCapture:
         )
         return False
     
-    def read_block(self) -> Optional[bytes]:
+    async def read_block(self) -> Optional[bytes]:
         """
-        Read a block of audio data.
+        Wait for the next captured block of audio data.
         
         Returns:
-            Raw audio bytes, or None on error.
+            Encoded audio bytes, or None if capture is not running or the
+            stream ended.
         """
         if not self.stream or not self.is_running:
             return None
         
+        return await self._queue.get()
+    
+    def _on_audio(self, indata, frames: int, time, status) -> None:
+        """
+        Stream callback run on the PortAudio thread for each captured block.
+        
+        Args:
+            indata: Raw interleaved int16 samples.
+            frames: Number of frames in the block.
+            time: PortAudio timing information (unused).
+            status: Stream status flags.
+        """
+        if status:
+            self.logger.debug(f"Audio stream status: {status}")
+        
+        if self._encode is not None:
+            self._encode(np.frombuffer(indata, dtype=np.int16), out=self._buf)
+            data = self._mv.tobytes()
+        else:
+            data = bytes(indata)
+        
+        self._loop.call_soon_threadsafe(self._enqueue, data)
+    
+    def _on_finished(self) -> None:
+        """Stream finished callback; wakes the reader if capture died."""
+        if not self.is_running:
+            # Expected after stop()
+            return
+        
+        self.logger.error("Audio stream ended unexpectedly (device lost or stream aborted)")
+        self.is_running = False
         try:
-            frames, _ = self.stream.read(self.config.block_size)
-            return frames.tobytes()
-        except Exception as e:
-            self.logger.error(f"Error reading audio block: {e}")
-            return None
+            self._loop.call_soon_threadsafe(self._enqueue, None)
+        except RuntimeError:
+            # Event loop already closed
+            pass
+    
+    def discard_pending(self) -> None:
+        """Drop captured blocks that have not been read yet."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+    
+    def _enqueue(self, data: Optional[bytes]) -> None:
+        """Queue a captured block, discarding the oldest one if full."""
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(data)
     
     def stop(self) -> None:
         """Stop capture and release device."""
         if self.stream:
+            # Clear first so the finished callback treats this as expected
+            self.is_running = False
             try:
                 self.stream.stop()
                 self.stream.close()
@@ -101,6 +171,8 @@ class AudioCapture:
         """
         Attempt to reinitialize after device error.
         
+        Like initialize(), must be called from the running event loop.
+        
         Returns:
             True if reinitialization succeeded, False otherwise.
         """
@@ -129,13 +201,15 @@ class AudioCapture:
             except AttributeError:
                 ws = None
             
-            self.stream = sd.InputStream(
+            self.stream = sd.RawInputStream(
                 device=idx,
                 samplerate=self.config.sample_rate,
                 channels=self.config.channels,
                 blocksize=self.config.block_size,
                 dtype="int16",
-                extra_settings=ws
+                extra_settings=ws,
+                callback=self._on_audio,
+                finished_callback=self._on_finished
             )
             self.stream.start()
             
@@ -154,12 +228,14 @@ class AudioCapture:
             try:
                 self.logger.debug(f"Trying Stereo Mix on device {idx}")
                 
-                self.stream = sd.InputStream(
+                self.stream = sd.RawInputStream(
                     device=idx,
                     samplerate=self.config.sample_rate,
                     channels=self.config.channels,
                     blocksize=self.config.block_size,
-                    dtype="int16"
+                    dtype="int16",
+                    callback=self._on_audio,
+                    finished_callback=self._on_finished
                 )
                 self.stream.start()
                 
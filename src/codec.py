@@ -0,0 +1,61 @@
+"""
+Audio codecs for the Audio Streamer server.
+
+Provides optional sample encodings that reduce bandwidth on the wire.
+Only imported when a non-PCM codec is configured, so Numba stays off the
+default startup path.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        """Fallback decorator used when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# G.711 mu-law constants
+_ULAW_BIAS = 0x84
+_ULAW_CLIP = 32635
+
+# Segment (exponent) lookup indexed by the top byte of the biased magnitude
+_ULAW_EXP_LUT = np.array(
+    [max(i.bit_length() - 1, 0) for i in range(256)],
+    dtype=np.int32
+)
+
+
+@njit(cache=True, fastmath=True)
+def _encode_ulaw(flat: np.ndarray, out: np.ndarray) -> None:
+    """Encode a flat int16 array into ``out`` in place."""
+    for i in range(flat.size):
+        s = np.int32(flat[i])
+        sign = (s >> 8) & 0x80
+        magnitude = min(abs(s), _ULAW_CLIP) + _ULAW_BIAS
+        exponent = _ULAW_EXP_LUT[(magnitude >> 7) & 0xFF]
+        mantissa = (magnitude >> (exponent + 3)) & 0x0F
+        out[i] = ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+def pcm16_to_ulaw(x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Encode int16 PCM samples as G.711 mu-law.
+
+    Args:
+        x: Array of int16 samples (any shape, interleaved channels).
+        out: Optional preallocated uint8 array with one slot per sample.
+
+    Returns:
+        Flat uint8 array with one mu-law byte per sample.
+    """
+    flat = x.reshape(-1)
+    if out is None:
+        out = np.empty(flat.size, dtype=np.uint8)
+    _encode_ulaw(flat, out)
+    return out
@@ -6,12 +6,23 @@ Handles loading, validating, and providing default configuration values.
 
 import json
 import logging
+import math
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
 from typing import Optional
 
+import orjson
 
-@dataclass
+
+
+# Bytes per sample on the wire for each supported codec
+SAMPLE_WIDTHS = {
+    "pcm16": 2,
+    "ulaw": 1,
+}
+
+
+@dataclass(slots=True)
 class ServerConfig:
     """Server configuration with sensible defaults."""
     
@@ -20,11 +31,29 @@ class ServerConfig:
     sample_rate: int = 44100
     channels: int = 2
     block_size: int = 1024
+    merge_factor: int = 2
+    compress: bool = False
+    codec: str = "pcm16"
+    client_buffer_ms: int = 500
     log_level: str = "INFO"
     max_reconnect_attempts: int = 10
     client_timeout_seconds: int = 30
 
 
+def client_buffer_frames(config: ServerConfig) -> int:
+    """
+    Convert client_buffer_ms into a per-client queue length in frames.
+    
+    Args:
+        config: Validated server configuration.
+        
+    Returns:
+        Number of merged frames that cover client_buffer_ms (at least 1).
+    """
+    frame_seconds = config.block_size * config.merge_factor / config.sample_rate
+    return max(1, math.ceil(config.client_buffer_ms / 1000 / frame_seconds))
+
+
 def load_config(path: str = "config.json") -> ServerConfig:
     """
     Load configuration from JSON file, creating template if missing.
@@ -37,18 +66,8 @@ def load_config(path: str = "config.json") -> ServerConfig:
     """
     config_path = Path(path)
     
-    if not config_path.exists():
-        # Create template config file with defaults
-        default_config = ServerConfig()
-        config_path.write_text(
-            json.dumps(asdict(default_config), indent=4),
-            encoding='utf-8'
-        )
-        return default_config
-    
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(config_path.read_bytes())
         
         config = ServerConfig(**{
             k: v for k, v in data.items() 
@@ -56,6 +75,14 @@ def load_config(path: str = "config.json") -> ServerConfig:
         })
         return validate_config(config)
         
+    except FileNotFoundError:
+        # Create template config file with defaults
+        default_config = ServerConfig()
+        config_path.write_text(
+            json.dumps(asdict(default_config), indent=4),
+            encoding='utf-8'
+        )
+        return default_config
     except json.JSONDecodeError as e:
         logging.warning(f"Invalid JSON in config file: {e}. Using defaults.")
         return ServerConfig()
@@ -93,6 +120,34 @@ def validate_config(config: ServerConfig) -> ServerConfig:
         )
         config.block_size = defaults.block_size
     
+    # Validate merge_factor (audio blocks per WebSocket frame)
+    if (
+        not isinstance(config.merge_factor, int)
+        or isinstance(config.merge_factor, bool)
+        or not (1 <= config.merge_factor <= 4)
+    ):
+        logging.warning(
+            f"Invalid merge_factor {config.merge_factor}. "
+            f"Using default {defaults.merge_factor}."
+        )
+        config.merge_factor = defaults.merge_factor
+    
+    # Validate compress
+    if not isinstance(config.compress, bool):
+        logging.warning(
+            f"Invalid compress {config.compress}. "
+            f"Using default {defaults.compress}."
+        )
+        config.compress = defaults.compress
+    
+    # Validate codec
+    if config.codec not in SAMPLE_WIDTHS:
+        logging.warning(
+            f"Invalid codec {config.codec}. "
+            f"Using default {defaults.codec}."
+        )
+        config.codec = defaults.codec
+    
     # Validate log_level
     valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
     if config.log_level.upper() not in valid_levels:
@@ -104,6 +159,18 @@ def validate_config(config: ServerConfig) -> ServerConfig:
     else:
         config.log_level = config.log_level.upper()
     
+    # Validate client_buffer_ms (per-client send backlog before dropping)
+    if (
+        not isinstance(config.client_buffer_ms, int)
+        or isinstance(config.client_buffer_ms, bool)
+        or not (50 <= config.client_buffer_ms <= 5000)
+    ):
+        logging.warning(
+            f"Invalid client_buffer_ms {config.client_buffer_ms}. "
+            f"Using default {defaults.client_buffer_ms}."
+        )
+        config.client_buffer_ms = defaults.client_buffer_ms
+    
     # Validate ports
     if not (1 <= config.http_port <= 65535):
         config.http_port = defaults.http_port
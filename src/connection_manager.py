@@ -4,37 +4,48 @@ Connection manager for the Audio Streamer server.
 Tracks connected clients and handles lifecycle events.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 
 import websockets
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientInfo:
     """Information about a connected client."""
     
     websocket: websockets.WebSocketServerProtocol
     connected_at: datetime
-    last_activity: datetime
+    connected_mono: float  # time.monotonic() matching connected_at
+    last_activity: float  # time.monotonic() of the last successful send
     address: str
+    queue: asyncio.Queue
     packets_sent: int = 0
+    packets_dropped: int = 0
+    writer_task: Optional[asyncio.Task] = None
 
 
 class ConnectionManager:
     """Tracks connected clients and handles lifecycle events."""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, queue_size: int = 32):
         """
         Initialize the connection manager.
         
         Args:
             logger: Logger instance for this module.
+            queue_size: Maximum number of pending frames per client. With
+                the default 1024-frame blocks merged in pairs at 44.1 kHz,
+                32 frames is about 1.5 s; server.py derives it from
+                config.client_buffer_ms.
         """
         self.clients: Dict[str, ClientInfo] = {}
         self.logger = logger
+        self.queue_size = queue_size
         self.total_served: int = 0
     
     def add_client(self, websocket: websockets.WebSocketServerProtocol) -> str:
@@ -47,15 +58,21 @@ class ConnectionManager:
         Returns:
             Client ID string.
         """
-        client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        now = datetime.now()
+        host, port = websocket.remote_address[:2]
+        client_id = f"{host}:{port}"
+        now_wall = datetime.now()
+        now_mono = time.monotonic()
         
-        self.clients[client_id] = ClientInfo(
+        client_info = ClientInfo(
             websocket=websocket,
-            connected_at=now,
-            last_activity=now,
-            address=client_id
+            connected_at=now_wall,
+            connected_mono=now_mono,
+            last_activity=now_mono,
+            address=client_id,
+            queue=asyncio.Queue(maxsize=self.queue_size)
         )
+        client_info.writer_task = asyncio.create_task(self._writer(client_id, client_info))
+        self.clients[client_id] = client_info
         self.total_served += 1
         
         self.logger.info(f"Client connected: {client_id}")
@@ -68,8 +85,10 @@ class ConnectionManager:
         Args:
             client_id: The client ID to remove.
         """
-        if client_id in self.clients:
-            del self.clients[client_id]
+        client_info = self.clients.pop(client_id, None)
+        if client_info:
+            if client_info.writer_task and client_info.writer_task is not asyncio.current_task():
+                client_info.writer_task.cancel()
             self.logger.info(f"Client disconnected: {client_id}")
     
     def get_active_clients(self) -> List[ClientInfo]:
@@ -81,46 +100,75 @@ class ConnectionManager:
         """
         return list(self.clients.values())
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, detailed: bool = False) -> Dict[str, Any]:
         """
         Return connection statistics.
         
+        Args:
+            detailed: Whether to include per-client entries.
+            
         Returns:
             Dictionary with connection stats.
         """
-        return {
+        stats: Dict[str, Any] = {
             "connected": len(self.clients),
-            "total_served": self.total_served,
-            "clients": [
+            "total_served": self.total_served
+        }
+        if detailed:
+            stats["clients"] = [
                 {
                     "address": c.address,
                     "connected_at": c.connected_at.isoformat(),
-                    "packets_sent": c.packets_sent
+                    "last_activity": (
+                        c.connected_at + timedelta(seconds=c.last_activity - c.connected_mono)
+                    ).isoformat(),
+                    "packets_sent": c.packets_sent,
+                    "packets_dropped": c.packets_dropped
                 }
                 for c in self.clients.values()
             ]
-        }
+        return stats
     
     async def broadcast(self, data: bytes) -> None:
         """
-        Send data to all connected clients, removing failed ones.
+        Queue data for every connected client without waiting on sends.
+        
+        Each client's writer task drains its own queue, so a slow client
+        only drops its own packets instead of stalling the others. When a
+        queue is full its oldest frame is dropped, keeping the stream live.
         
         Args:
             data: Raw audio bytes to broadcast.
         """
-        failed_clients = []
+        for client_info in self.clients.values():
+            queue = client_info.queue
+            if queue.full():
+                queue.get_nowait()
+                client_info.packets_dropped += 1
+            queue.put_nowait(data)
+    
+    async def _writer(self, client_id: str, client_info: ClientInfo) -> None:
+        """
+        Send queued data to a single client until it fails or is removed.
         
-        for client_id, client_info in self.clients.items():
-            try:
-                await client_info.websocket.send(data)
-                client_info.packets_sent += 1
-                client_info.last_activity = datetime.now()
-            except Exception as e:
-                self.logger.debug(f"Failed to send to {client_id}: {e}")
-                failed_clients.append(client_id)
+        Args:
+            client_id: The client ID being served.
+            client_info: The client's connection information.
+        """
+        send = client_info.websocket.send
+        get = client_info.queue.get
+        monotonic = time.monotonic
         
-        # Remove failed clients
-        for client_id in failed_clients:
+        try:
+            while True:
+                data = await get()
+                await send(data)
+                client_info.packets_sent += 1
+                client_info.last_activity = monotonic()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.debug(f"Failed to send to {client_id}: {e}")
             self.remove_client(client_id)
     
     async def close_all(self, reason: str = "Server shutting down") -> None:
@@ -132,10 +180,18 @@ class ConnectionManager:
         """
         self.logger.info(f"Closing all connections: {reason}")
         
-        for client_id, client_info in list(self.clients.items()):
-            try:
-                await client_info.websocket.close(1001, reason)
-            except Exception as e:
-                self.logger.debug(f"Error closing {client_id}: {e}")
+        clients = list(self.clients.items())
+        for _, client_info in clients:
+            if client_info.writer_task:
+                client_info.writer_task.cancel()
+        
+        # Run the close handshakes in parallel rather than one after another
+        results = await asyncio.gather(
+            *(client_info.websocket.close(1001, reason) for _, client_info in clients),
+            return_exceptions=True
+        )
+        for (client_id, _), result in zip(clients, results):
+            if isinstance(result, Exception):
+                self.logger.debug(f"Error closing {client_id}: {result}")
         
         self.clients.clear()
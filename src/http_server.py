@@ -4,13 +4,15 @@ HTTP server module for the Audio Streamer.
 Serves the client UI and status endpoints.
 """
 
-import os
+import functools
 import socket
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from flask import Flask, send_from_directory, jsonify
+import orjson
+from aiohttp import web
 
 from .config import ServerConfig
 from .connection_manager import ConnectionManager
@@ -19,14 +21,20 @@ from .connection_manager import ConnectionManager
 # Server start time for uptime calculation
 _start_time: Optional[datetime] = None
 
+# How long a serialized /status body may be reused
+STATUS_CACHE_TTL = 0.5
+
 # Get the project root directory (parent of src/)
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 
 
+@functools.lru_cache(maxsize=1)
 def get_local_ip() -> str:
     """
     Get the local IP address of this machine.
     
+    The result is cached; the LAN address does not change while serving.
+    
     Returns:
         Local IP address string.
     """
@@ -44,9 +52,9 @@ def create_app(
     connection_manager: ConnectionManager,
     config: ServerConfig,
     audio_device_info: Optional[dict] = None
-) -> Flask:
+) -> web.Application:
     """
-    Create Flask app with routes.
+    Create aiohttp app with routes.
     
     Args:
         connection_manager: Connection manager instance.
@@ -54,36 +62,42 @@ def create_app(
         audio_device_info: Optional audio device information.
         
     Returns:
-        Configured Flask application.
+        Configured aiohttp application.
     """
     global _start_time
     _start_time = datetime.now()
     
-    app = Flask(__name__)
+    # /config never changes at runtime; /status is rebuilt at most every TTL
+    config_body = orjson.dumps({
+        "ws_port": config.ws_port,
+        "sample_rate": config.sample_rate,
+        "channels": config.channels,
+        "compress": config.compress,
+        "codec": config.codec,
+        "host": get_local_ip()
+    })
+    status_cache = {"ts": float("-inf"), "body": b""}
     
-    @app.route('/')
-    def index():
+    async def index(request: web.Request) -> web.FileResponse:
         """Serve the client HTML page."""
-        return send_from_directory(PROJECT_ROOT, 'client.html')
-    
-    @app.route('/static/js/<path:filename>')
-    def serve_js(filename):
-        """Serve JavaScript files."""
-        return send_from_directory(PROJECT_ROOT / 'static' / 'js', filename)
+        return web.FileResponse(PROJECT_ROOT / 'client.html')
     
-    @app.route('/status')
-    def status():
-        """Return JSON with server health metrics."""
+    def build_status(detailed: bool) -> bytes:
+        """Serialize the /status payload, optionally with per-client entries."""
         uptime = (datetime.now() - _start_time).total_seconds() if _start_time else 0
-        client_stats = connection_manager.get_stats()
+        client_stats = connection_manager.get_stats(detailed=detailed)
         
-        return jsonify({
+        clients = {
+            "connected": client_stats["connected"],
+            "total_served": client_stats["total_served"]
+        }
+        if detailed:
+            clients["details"] = client_stats["clients"]
+        
+        return orjson.dumps({
             "status": "running",
             "uptime_seconds": int(uptime),
-            "clients": {
-                "connected": client_stats["connected"],
-                "total_served": client_stats["total_served"]
-            },
+            "clients": clients,
             "audio": audio_device_info or {
                 "device": "Unknown",
                 "sample_rate": config.sample_rate,
@@ -95,14 +109,26 @@ def create_app(
             }
         })
     
-    @app.route('/config')
-    def get_config():
+    async def status(request: web.Request) -> web.Response:
+        """Return JSON with server health metrics (?detailed=1 adds per-client stats)."""
+        if request.query.get('detailed') in ('1', 'true'):
+            # Per-client view is rare and always fresh, so it bypasses the cache
+            return web.Response(body=build_status(True), content_type='application/json')
+        
+        now = time.monotonic()
+        if now - status_cache["ts"] >= STATUS_CACHE_TTL:
+            status_cache["body"] = build_status(False)
+            status_cache["ts"] = now
+        
+        return web.Response(body=status_cache["body"], content_type='application/json')
+    
+    async def get_config(request: web.Request) -> web.Response:
         """Return client-relevant configuration."""
-        return jsonify({
-            "ws_port": config.ws_port,
-            "sample_rate": config.sample_rate,
-            "channels": config.channels,
-            "host": get_local_ip()
-        })
+        return web.Response(body=config_body, content_type='application/json')
     
+    app = web.Application()
+    app.router.add_get('/', index)
+    app.router.add_get('/status', status)
+    app.router.add_get('/config', get_config)
+    app.router.add_static('/static/js', PROJECT_ROOT / 'static' / 'js')
     return app
@@ -6,11 +6,13 @@ Handles WebSocket connections and audio broadcasting.
 
 import asyncio
 import logging
+import time
+import zlib
 from typing import Optional
 
 import websockets
 
-from .config import ServerConfig
+from .config import SAMPLE_WIDTHS, ServerConfig
 from .audio_capture import AudioCapture
 from .connection_manager import ConnectionManager
 
@@ -65,14 +67,66 @@ class AudioWebSocketServer:
         """Main loop for capturing and broadcasting audio."""
         self.logger.info("Starting audio broadcast loop")
         
+        # Coalesce several capture blocks into one frame to cut send() overhead
+        frame_bytes = (
+            self.config.block_size * self.config.channels
+            * SAMPLE_WIDTHS[self.config.codec] * self.config.merge_factor
+        )
+        max_delay = (
+            self.config.block_size * self.config.merge_factor / self.config.sample_rate
+        )
+        idle_delay = self.config.block_size / self.config.sample_rate / 2
+        
+        # Preallocated frame buffer; filled in place instead of regrown per frame
+        buf = bytearray(frame_bytes)
+        view = memoryview(buf)
+        filled = 0
+        deadline = 0.0
+        
+        # Bind hot-path lookups once instead of per block
+        read = self.audio_capture.read_block
+        discard_pending = self.audio_capture.discard_pending
+        broadcast = self.connection_manager.broadcast
+        clients = self.connection_manager.clients
+        compress = self.config.compress
+        monotonic = time.monotonic
+        
         while self.is_running:
-            data = self.audio_capture.read_block()
+            if not clients:
+                # Nobody listening; drop stale audio so new clients start live
+                filled = 0
+                discard_pending()
+                await asyncio.sleep(idle_delay)
+                continue
+            
+            if filled:
+                # Don't hold a partial frame past its deadline if capture stalls
+                try:
+                    data = await asyncio.wait_for(read(), max(0.0, deadline - monotonic()))
+                except asyncio.TimeoutError:
+                    data = b""
+            else:
+                data = await read()
+            
+            if data is None:
+                # Capture is not running; wait instead of spinning
+                await asyncio.sleep(idle_delay)
+                continue
             
-            if data:
-                await self.connection_manager.broadcast(data)
+            if not filled:
+                deadline = monotonic() + max_delay
+            end = filled + len(data)
+            view[filled:end] = data
+            filled = end
             
-            # Let event loop breathe
-            await asyncio.sleep(0)
+            if filled >= frame_bytes or monotonic() >= deadline:
+                if compress:
+                    # Compress once; every client shares the same bytes object
+                    payload = zlib.compress(view[:filled], 1)
+                else:
+                    payload = bytes(view[:filled])
+                await broadcast(payload)
+                filled = 0
     
     async def start(self, host: str = "0.0.0.0") -> None:
         """
@@ -83,10 +137,14 @@ class AudioWebSocketServer:
         """
         self.is_running = True
         
+        # Audio goes out as bytes, so every frame uses the binary opcode and
+        # skips UTF-8 handling; per-message deflate stays off so the library
+        # never compresses the same payload once per client.
         self.server = await websockets.serve(
             self.handler,
             host,
             self.config.ws_port,
+            compression=None,
             max_size=None
         )
         
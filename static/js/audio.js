@@ -4,6 +4,34 @@
  * @module audio
  */
 
+/**
+ * G.711 mu-law to int16 PCM lookup table.
+ */
+const ULAW_TABLE = (() => {
+    const table = new Int16Array(256);
+    for (let i = 0; i < 256; i++) {
+        const u = ~i & 0xFF;
+        const exponent = (u >> 4) & 0x07;
+        const mantissa = u & 0x0F;
+        const sample = (((mantissa << 3) + 0x84) << exponent) - 0x84;
+        table[i] = (u & 0x80) ? -sample : sample;
+    }
+    return table;
+})();
+
+/**
+ * Decode mu-law bytes into int16 PCM samples.
+ * @param {Uint8Array} bytes - Mu-law encoded samples.
+ * @returns {Int16Array} Decoded PCM samples.
+ */
+function ulawToPcm16(bytes) {
+    const pcm = new Int16Array(bytes.length);
+    for (let i = 0; i < bytes.length; i++) {
+        pcm[i] = ULAW_TABLE[bytes[i]];
+    }
+    return pcm;
+}
+
 /**
  * Manages audio playback with Web Audio API.
  */
@@ -13,11 +41,13 @@ export class AudioEngine {
      * @param {Object} options - Configuration options.
      * @param {number} options.sampleRate - Audio sample rate (default: 44100).
      * @param {number} options.channels - Number of channels (default: 2).
+     * @param {string} options.codec - Wire codec, 'pcm16' or 'ulaw' (default: 'pcm16').
      * @param {Function} options.onVisualizationData - Callback for visualization data.
      */
     constructor(options = {}) {
         this.sampleRate = options.sampleRate || 44100;
         this.channels = options.channels || 2;
+        this.codec = options.codec || 'pcm16';
         this.onVisualizationData = options.onVisualizationData || (() => {});
         
         this.context = null;
@@ -120,12 +150,14 @@ export class AudioEngine {
     
     /**
      * Process incoming audio data.
-     * @param {ArrayBuffer} data - Raw PCM audio data.
+     * @param {ArrayBuffer} data - Encoded audio data.
      */
     processAudioData(data) {
         if (!this.isInitialized) return;
         
-        const pcm = new Int16Array(data);
+        const pcm = this.codec === 'ulaw'
+            ? ulawToPcm16(new Uint8Array(data))
+            : new Int16Array(data);
         
         // Buffer management during pause
         if (this.isPaused) {
@@ -139,7 +171,7 @@ export class AudioEngine {
             }
             
             // Discard oldest if exceeding limit
-            while (currentSize + data.byteLength > maxBufferBytes && this.queue.length > 0) {
+            while (currentSize + pcm.byteLength > maxBufferBytes && this.queue.length > 0) {
                 const removed = this.queue.shift();
                 currentSize -= removed.byteLength;
             }
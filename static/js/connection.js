@@ -23,11 +23,13 @@ export class ConnectionHandler {
      * Create a connection handler.
      * @param {Object} options - Configuration options.
      * @param {string} options.wsUrl - WebSocket URL.
+     * @param {boolean} options.compressed - Whether frames are zlib-compressed.
      * @param {Function} options.onData - Callback for received data.
      * @param {Function} options.onStatusChange - Callback for status changes.
      */
     constructor(options) {
         this.wsUrl = options.wsUrl;
+        this.compressed = options.compressed || false;
         this.onData = options.onData || (() => {});
         this.onStatusChange = options.onStatusChange || (() => {});
         
@@ -38,6 +40,7 @@ export class ConnectionHandler {
         this.maxDelay = 30000;
         this.reconnectTimer = null;
         this.status = ConnectionStatus.DISCONNECTED;
+        this._decodeChain = Promise.resolve();
     }
     
     /**
@@ -69,7 +72,16 @@ export class ConnectionHandler {
             };
             
             this.ws.onmessage = (event) => {
-                this.onData(event.data);
+                if (!this.compressed) {
+                    this.onData(event.data);
+                    return;
+                }
+                
+                // Chain decodes so frames are delivered in arrival order
+                this._decodeChain = this._decodeChain
+                    .then(() => this._inflate(event.data))
+                    .then((data) => this.onData(data))
+                    .catch((error) => console.error('Failed to decompress frame:', error));
             };
             
             this.ws.onerror = (error) => {
@@ -131,6 +143,17 @@ export class ConnectionHandler {
         }, delay);
     }
     
+    /**
+     * Decompress a zlib-compressed frame.
+     * @param {ArrayBuffer} data - Compressed frame.
+     * @returns {Promise<ArrayBuffer>} Decompressed PCM data.
+     * @private
+     */
+    _inflate(data) {
+        const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('deflate'));
+        return new Response(stream).arrayBuffer();
+    }
+    
     /**
      * Update status and notify callback.
      * @param {string} status - New status.
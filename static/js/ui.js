@@ -39,7 +39,8 @@ export class UIController {
         // Initialize audio engine
         this.audioEngine = new AudioEngine({
             sampleRate: config.sample_rate || 44100,
-            channels: config.channels || 2
+            channels: config.channels || 2,
+            codec: config.codec || 'pcm16'
         });
         
         // Initialize visualizer if canvas exists
@@ -50,6 +51,7 @@ export class UIController {
         // Initialize connection handler
         this.connectionHandler = new ConnectionHandler({
             wsUrl: wsUrl,
+            compressed: Boolean(config.compress),
             onData: (data) => this._handleAudioData(data),
             onStatusChange: (status, details) => this._handleStatusChange(status, details)
         });
@@ -0,0 +1,54 @@
+"""Tests for the mu-law codec."""
+
+import numpy as np
+
+from src.codec import pcm16_to_ulaw
+
+
+def _decode_table() -> np.ndarray:
+    """Build the same mu-law decode table the browser client uses."""
+    table = []
+    for i in range(256):
+        u = ~i & 0xFF
+        exponent = (u >> 4) & 0x07
+        mantissa = u & 0x0F
+        sample = (((mantissa << 3) + 0x84) << exponent) - 0x84
+        table.append(-sample if u & 0x80 else sample)
+    return np.array(table, dtype=np.int32)
+
+
+ULAW_DECODE = _decode_table()
+
+
+def test_round_trip_full_range():
+    """Every int16 value survives encode/decode within mu-law error bounds."""
+    x = np.arange(-32768, 32768, dtype=np.int16)
+    decoded = ULAW_DECODE[pcm16_to_ulaw(x)]
+    expected = np.clip(x.astype(np.int32), -32635, 32635)
+    error = np.abs(decoded - expected)
+    
+    large = np.abs(expected) >= 256
+    assert np.all(error[large] <= 0.05 * np.abs(expected[large]))
+    assert np.all(error[~large] <= 8)
+
+
+def test_zero_and_clip():
+    """Zero decodes to silence and the extremes clip symmetrically."""
+    codes = pcm16_to_ulaw(np.array([0, -32768, 32767], dtype=np.int16))
+    
+    assert codes[0] == 0xFF
+    assert ULAW_DECODE[codes[0]] == 0
+    assert ULAW_DECODE[codes[1]] == -32124
+    assert ULAW_DECODE[codes[2]] == 32124
+
+
+def test_output_buffer_and_shape():
+    """Interleaved 2-D input is flattened into a caller-supplied buffer."""
+    frames = np.zeros((1024, 2), dtype=np.int16)
+    out = np.empty(2048, dtype=np.uint8)
+    
+    result = pcm16_to_ulaw(frames, out=out)
+    
+    assert result is out
+    assert result.dtype == np.uint8
+    assert np.all(result == 0xFF)
@@ -0,0 +1,49 @@
+"""Tests for configuration validation."""
+
+from src.config import ServerConfig, client_buffer_frames, validate_config
+
+
+def test_unknown_codec_resets_to_default():
+    """Unknown codec names fall back to pcm16."""
+    assert validate_config(ServerConfig(codec="opus")).codec == "pcm16"
+    assert validate_config(ServerConfig(codec="ulaw")).codec == "ulaw"
+
+
+def test_invalid_merge_factor_resets_to_default():
+    """merge_factor outside 1-4 or not an int falls back to the default."""
+    for value in (0, 5, -1, 2.5, 2.0, "2", True):
+        config = validate_config(ServerConfig(merge_factor=value))
+        assert config.merge_factor == ServerConfig().merge_factor
+        assert type(config.merge_factor) is int
+
+
+def test_valid_merge_factor_is_kept():
+    """merge_factor within range is preserved."""
+    assert validate_config(ServerConfig(merge_factor=4)).merge_factor == 4
+
+
+def test_non_bool_compress_resets_to_default():
+    """Truthy non-bool compress values are rejected."""
+    for value in ("yes", 1, None):
+        config = validate_config(ServerConfig(compress=value))
+        assert config.compress is ServerConfig().compress
+
+
+def test_bool_compress_is_kept():
+    """A real bool compress flag is preserved."""
+    assert validate_config(ServerConfig(compress=True)).compress is True
+
+
+def test_invalid_client_buffer_ms_resets_to_default():
+    """client_buffer_ms outside 50-5000 or not an int falls back to the default."""
+    for value in (0, 10, 10000, 500.0, True):
+        config = validate_config(ServerConfig(client_buffer_ms=value))
+        assert config.client_buffer_ms == ServerConfig().client_buffer_ms
+
+
+def test_client_buffer_frames_covers_requested_time():
+    """The per-client queue length covers client_buffer_ms of merged frames."""
+    # 2048-frame merged frames at 44.1 kHz are ~46 ms each
+    assert client_buffer_frames(ServerConfig(client_buffer_ms=500)) == 11
+    assert client_buffer_frames(ServerConfig(client_buffer_ms=50)) == 2
+    assert client_buffer_frames(ServerConfig(merge_factor=4, block_size=4096, client_buffer_ms=50)) == 1
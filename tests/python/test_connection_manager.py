@@ -0,0 +1,117 @@
+"""Tests for per-client queues and writer tasks in ConnectionManager."""
+
+import asyncio
+import logging
+
+from src.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a websockets connection."""
+
+    def __init__(self, port: int, fail: bool = False, block: bool = False):
+        self.remote_address = ("10.0.0.1", port)
+        self.sent = []
+        self.closed_with = None
+        self.fail = fail
+        self.release = asyncio.Event()
+        if not block:
+            self.release.set()
+
+    async def send(self, data: bytes) -> None:
+        await self.release.wait()
+        if self.fail:
+            raise ConnectionError("gone")
+        self.sent.append(data)
+
+    async def close(self, code: int, reason: str) -> None:
+        self.closed_with = (code, reason)
+
+
+def _manager(queue_size: int = 32) -> ConnectionManager:
+    return ConnectionManager(logging.getLogger("test"), queue_size=queue_size)
+
+
+def test_broadcast_reaches_every_client_in_order():
+    """Each client's writer sends queued frames in broadcast order."""
+    async def scenario():
+        manager = _manager()
+        a, b = FakeWebSocket(1), FakeWebSocket(2)
+        manager.add_client(a)
+        manager.add_client(b)
+
+        for i in range(3):
+            await manager.broadcast(bytes([i]))
+        await asyncio.sleep(0.01)
+
+        assert a.sent == [b"\x00", b"\x01", b"\x02"]
+        assert b.sent == a.sent
+        assert all(c.packets_sent == 3 for c in manager.clients.values())
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_drops_oldest_frame_for_slow_client_only():
+    """A stalled client loses its oldest frames; others are unaffected."""
+    async def scenario():
+        manager = _manager(queue_size=2)
+        slow, fast = FakeWebSocket(1, block=True), FakeWebSocket(2)
+        slow_id = manager.add_client(slow)
+        manager.add_client(fast)
+        await asyncio.sleep(0)
+
+        for i in range(5):
+            await manager.broadcast(bytes([i]))
+            await asyncio.sleep(0)
+
+        # Writer holds frame 0 in send(); queue keeps the newest two
+        slow_info = manager.clients[slow_id]
+        assert slow_info.packets_dropped == 2
+        slow.release.set()
+        await asyncio.sleep(0.01)
+
+        assert slow.sent == [b"\x00", b"\x03", b"\x04"]
+        assert fast.sent == [bytes([i]) for i in range(5)]
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_failed_send_removes_client():
+    """A writer whose send raises removes its client."""
+    async def scenario():
+        manager = _manager()
+        good, bad = FakeWebSocket(1), FakeWebSocket(2, fail=True)
+        good_id = manager.add_client(good)
+        manager.add_client(bad)
+
+        await manager.broadcast(b"x")
+        await asyncio.sleep(0.01)
+
+        assert list(manager.clients) == [good_id]
+        assert manager.total_served == 2
+        await manager.close_all()
+
+    asyncio.run(scenario())
+
+
+def test_close_all_cancels_writers_and_closes_clients():
+    """close_all cancels writer tasks, sends 1001 to everyone and clears."""
+    async def scenario():
+        manager = _manager()
+        sockets = [FakeWebSocket(port, block=True) for port in range(3)]
+        for ws in sockets:
+            manager.add_client(ws)
+        writers = [c.writer_task for c in manager.clients.values()]
+        await manager.broadcast(b"x")
+        await asyncio.sleep(0)
+
+        await manager.close_all("bye")
+        await asyncio.sleep(0)
+
+        assert manager.clients == {}
+        assert all(task.cancelled() for task in writers)
+        assert all(ws.closed_with == (1001, "bye") for ws in sockets)
+
+    asyncio.run(scenario())
@@ -0,0 +1,102 @@
+"""Tests for the /status and /config endpoints."""
+
+import asyncio
+import logging
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from src import http_server
+from src.config import ServerConfig
+from src.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a websockets connection."""
+
+    remote_address = ("10.0.0.1", 4000)
+
+    async def send(self, data: bytes) -> None:
+        pass
+
+    async def close(self, code: int, reason: str) -> None:
+        pass
+
+
+async def _get_json(client: TestClient, path: str) -> dict:
+    response = await client.get(path)
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    return await response.json()
+
+
+def _run(scenario) -> None:
+    """Run scenario(client, manager) against a live test server."""
+    async def main():
+        manager = ConnectionManager(logging.getLogger("test"))
+        app = http_server.create_app(manager, ServerConfig())
+        async with TestClient(TestServer(app)) as client:
+            await scenario(client, manager)
+
+    asyncio.run(main())
+
+
+def test_status_is_cached_within_ttl():
+    """Repeated /status hits within the TTL reuse the serialized body."""
+    async def scenario(client, manager):
+        first = await _get_json(client, "/status")
+        manager.total_served = 7
+        second = await _get_json(client, "/status")
+
+        assert second == first
+        assert second["clients"]["total_served"] == 0
+        assert "details" not in second["clients"]
+
+    _run(scenario)
+
+
+def test_status_refreshes_after_ttl(monkeypatch):
+    """Once the TTL expires /status reflects current stats."""
+    monkeypatch.setattr(http_server, "STATUS_CACHE_TTL", 0.0)
+
+    async def scenario(client, manager):
+        await _get_json(client, "/status")
+        manager.total_served = 7
+        body = await _get_json(client, "/status")
+
+        assert body["clients"]["total_served"] == 7
+
+    _run(scenario)
+
+
+def test_detailed_status_bypasses_cache():
+    """?detailed=1 is always fresh and lists per-client stats."""
+    async def scenario(client, manager):
+        await _get_json(client, "/status")
+        manager.add_client(FakeWebSocket())
+        await manager.broadcast(b"x")
+        await asyncio.sleep(0.01)
+
+        body = await _get_json(client, "/status?detailed=1")
+        (details,) = body["clients"]["details"]
+
+        assert body["clients"]["connected"] == 1
+        assert details["address"] == "10.0.0.1:4000"
+        assert details["packets_sent"] == 1
+        assert details["packets_dropped"] == 0
+        assert details["last_activity"] >= details["connected_at"]
+        await manager.close_all()
+
+    _run(scenario)
+
+
+def test_config_reports_client_settings():
+    """/config exposes what the browser needs to decode the stream."""
+    async def scenario(client, manager):
+        body = await _get_json(client, "/config")
+
+        assert body["ws_port"] == 8765
+        assert body["codec"] == "pcm16"
+        assert body["compress"] is False
+        assert "host" in body
+
+    _run(scenario)
@@ -0,0 +1,154 @@
+"""Tests for frame merging in AudioWebSocketServer.broadcast_loop."""
+
+import asyncio
+import logging
+
+from src.config import ServerConfig
+from src.ws_server import AudioWebSocketServer
+
+
+BLOCK_BYTES = 1024 * 2 * 2  # default block_size * channels * int16
+
+
+class FakeCapture:
+    """Capture stand-in fed directly by the test."""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.discarded = 0
+
+    async def read_block(self):
+        return await self.queue.get()
+
+    def discard_pending(self) -> None:
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.discarded += 1
+
+
+class RecordingManager:
+    """Connection manager stand-in that records broadcast frames."""
+
+    def __init__(self, connected: bool = True):
+        self.clients = {"client": object()} if connected else {}
+        self.frames = []
+
+    async def broadcast(self, data: bytes) -> None:
+        self.frames.append(data)
+
+
+def _start(config: ServerConfig, capture: FakeCapture, manager: RecordingManager):
+    server = AudioWebSocketServer(config, capture, manager, logging.getLogger("test"))
+    server.is_running = True
+    return server, asyncio.create_task(server.broadcast_loop())
+
+
+async def _stop(server: AudioWebSocketServer, task: asyncio.Task) -> None:
+    server.is_running = False
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def test_blocks_are_merged_into_one_frame():
+    """merge_factor consecutive blocks go out as a single frame."""
+    async def scenario():
+        capture, manager = FakeCapture(), RecordingManager()
+        server, task = _start(ServerConfig(merge_factor=3), capture, manager)
+
+        blocks = [bytes([i]) * BLOCK_BYTES for i in range(3)]
+        for block in blocks[:2]:
+            capture.queue.put_nowait(block)
+        await asyncio.sleep(0.005)
+        assert manager.frames == []
+
+        capture.queue.put_nowait(blocks[2])
+        await asyncio.sleep(0.005)
+        assert manager.frames == [b"".join(blocks)]
+        await _stop(server, task)
+
+    asyncio.run(scenario())
+
+
+def test_partial_frame_flushes_when_capture_stalls():
+    """A partial frame is sent once its deadline passes with no new block."""
+    async def scenario():
+        capture, manager = FakeCapture(), RecordingManager()
+        server, task = _start(ServerConfig(), capture, manager)
+
+        capture.queue.put_nowait(b"\x01" * BLOCK_BYTES)
+        await asyncio.sleep(0.01)
+        assert manager.frames == []
+
+        # Deadline is merge_factor blocks of audio (~46 ms at defaults)
+        await asyncio.sleep(0.08)
+        assert manager.frames == [b"\x01" * BLOCK_BYTES]
+        await _stop(server, task)
+
+    asyncio.run(scenario())
+
+
+def test_idle_loop_discards_stale_blocks():
+    """Blocks captured with no clients connected are dropped, not sent later."""
+    async def scenario():
+        capture, manager = FakeCapture(), RecordingManager(connected=False)
+        server, task = _start(ServerConfig(merge_factor=1), capture, manager)
+
+        for _ in range(4):
+            capture.queue.put_nowait(b"\x00" * BLOCK_BYTES)
+        await asyncio.sleep(0.03)
+        assert capture.discarded == 4
+
+        manager.clients["client"] = object()
+        await asyncio.sleep(0.03)
+        capture.queue.put_nowait(b"\x02" * BLOCK_BYTES)
+        await asyncio.sleep(0.005)
+        assert manager.frames == [b"\x02" * BLOCK_BYTES]
+        await _stop(server, task)
+
+    asyncio.run(scenario())
+
+
+def test_loop_survives_capture_end():
+    """A None block (stream ended) does not kill the loop."""
+    async def scenario():
+        capture, manager = FakeCapture(), RecordingManager()
+        server, task = _start(ServerConfig(merge_factor=1), capture, manager)
+
+        capture.queue.put_nowait(None)
+        await asyncio.sleep(0.03)
+        assert not task.done()
+
+        capture.queue.put_nowait(b"\x03" * BLOCK_BYTES)
+        await asyncio.sleep(0.005)
+        assert manager.frames == [b"\x03" * BLOCK_BYTES]
+        await _stop(server, task)
+
+    asyncio.run(scenario())
+
+
+def test_reused_frame_buffer_does_not_leak_previous_frame():
+    """Consecutive frames, including a short flushed one, carry only their own bytes."""
+    async def scenario():
+        capture, manager = FakeCapture(), RecordingManager()
+        server, task = _start(ServerConfig(), capture, manager)
+
+        for i in (1, 2):
+            capture.queue.put_nowait(bytes([i]) * BLOCK_BYTES)
+        await asyncio.sleep(0.005)
+        capture.queue.put_nowait(b"\x03" * BLOCK_BYTES)
+        await asyncio.sleep(0.08)
+        for i in (4, 5):
+            capture.queue.put_nowait(bytes([i]) * BLOCK_BYTES)
+        await asyncio.sleep(0.005)
+
+        assert manager.frames == [
+            b"\x01" * BLOCK_BYTES + b"\x02" * BLOCK_BYTES,
+            b"\x03" * BLOCK_BYTES,
+            b"\x04" * BLOCK_BYTES + b"\x05" * BLOCK_BYTES,
+        ]
+        await _stop(server, task)
+
+    asyncio.run(scenario())